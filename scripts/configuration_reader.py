@@ -1,23 +1,88 @@
 import yaml
 import os
 import logging
-import sys
+import mmap
+import pickle
+from collections import OrderedDict
+
+# Module logger, so importing this module never configures the root logger
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, 'CSafeLoader', None)
+if Loader is None:
+    logger.warning('PyYAML was built without libyaml, falling back to the slower pure-Python SafeLoader')
+    Loader = yaml.SafeLoader
+
+# Pickled parsed configs, keyed by (absolute path, mtime, size) of the file they came from.
+# Stored pickled so every hit unpickles a fresh copy: callers may mutate what they get back.
+# Bounded, so a long-running process does not keep every edited version of a config alive.
+# Not thread-safe: _cache_get/_cache_put do unlocked get/move_to_end/popitem sequences,
+# so concurrent read_config calls from several threads need their own lock
+_CFG_CACHE = OrderedDict()
+_CFG_CACHE_MAXSIZE = 8
+
+class ConfigError(Exception):
+    """Raised when a configuration file cannot be found or parsed."""
 
 # TODO: Implement a function to validate the configuration
 def validate_config(config):
     # Add validation logic here
     pass
 
+# Read-only view of a memory-mapped config that keeps the file's name,
+# so YAML error marks still point at the config file instead of "<file>"
+class _NamedMap:
+    def __init__(self, mm, name):
+        self.read = mm.read
+        self.name = name
+
+# Parse the YAML straight from a read-only memory map of the file
+def _load_yaml(file):
+    try:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # mmap refuses empty files, read them the plain way instead
+        return yaml.load(file, Loader=Loader)
+    with mm:
+        return yaml.load(_NamedMap(mm, file.name), Loader=Loader)
+
+# Look up a pickled config in the in-process cache, marking it most recently used (not thread-safe)
+def _cache_get(key):
+    blob = _CFG_CACHE.get(key)
+    if blob is not None:
+        _CFG_CACHE.move_to_end(key)
+    return blob
+
+# Store a parsed config, evicting the least recently used one when the cache is full (not thread-safe)
+def _cache_put(key, config):
+    blob = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    _CFG_CACHE[key] = blob
+    _CFG_CACHE.move_to_end(key)
+    while len(_CFG_CACHE) > _CFG_CACHE_MAXSIZE:
+        _CFG_CACHE.popitem(last=False)
+
 # Read and validate the configuration
 def read_config(config_file):
     try:
-        with open(config_file, 'r') as file:
-            config = yaml.safe_load(file)
-            validate_config(config)
-            return config
-    except FileNotFoundError:
-        logging.error(f"Config file '{config_file}' not found.")
-        sys.exit(1)
+        st = os.stat(config_file)
+        key = (os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+        blob = _cache_get(key)
+        if blob is not None:
+            return pickle.loads(blob)
+
+        with open(config_file, 'rb') as file:
+            config = _load_yaml(file)
+        validate_config(config)
+        _cache_put(key, config)
+        return config
+    except FileNotFoundError as e:
+        logger.error("Config file '%s' not found.", config_file)
+        raise ConfigError(f"Config file '{config_file}' not found.") from e
     except yaml.YAMLError as e:
-        logging.error(f"Error parsing config file: {e}")
-        sys.exit(1)
+        logger.error("Error parsing config file '%s': %s", config_file, e)
+        raise ConfigError(f"Error parsing config file '{config_file}': {e}") from e
+    except ValueError as e:
+        # Well-formed YAML with a value its constructor rejects, e.g. an impossible date
+        logger.error("Invalid value in config file '%s': %s", config_file, e)
+        raise ConfigError(f"Invalid value in config file '{config_file}': {e}") from e
@@ -1,12 +1,24 @@
 import pandas as pd
 import numpy as np
+import csv
 import json
+import os
 from pathlib import Path
-from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain, combinations
+from operator import itemgetter
 
 # Import new auxiliary data processing functions
 from process_auxiliary_data import process_locations, process_thresholds, process_historical_ground_truth
 
+# Quantiles kept from hospitalization predictions, as the strings `output_type_id` gets cast to
+DESIRED_QUANTILES = ["0.025", "0.05", "0.25", "0.5", "0.75", "0.95", "0.975"]
+
+# One calendar day, built once for the date arithmetic in the per-model partition loop
+ONE_DAY = np.timedelta64(1, "D")
+
 
 # ========================
 # === HELPER FUNCTIONS ===
@@ -37,6 +49,16 @@ class NpEncoder(json.JSONEncoder):
         return super(NpEncoder, self).default(obj)
 
 
+@lru_cache(maxsize=4096)
+def format_iso_date(date):
+    """
+    Formats a date as a "YYYY-MM-DD" string.
+    Memoized, since the same handful of dates repeat across every row/location.
+    """
+    # isoformat() skips strftime's format-string machinery for the same output
+    return date.date().isoformat() if isinstance(date, datetime) else date.isoformat()
+
+
 def calculate_boxplot_stats(series):
     """
     Calculates all required statistics for a box plot from a pandas Series.
@@ -65,16 +87,125 @@ def calculate_boxplot_stats(series):
     }
 
 
+def slice_by_date_range(df, date_col, start, end):
+    """
+    Returns the rows of `df` whose `date_col` falls within [start, end].
+    `df` must already be sorted by `date_col`, so both bounds are found by binary search
+    instead of comparing every row.
+    """
+    dates = df[date_col]
+    return df.iloc[dates.searchsorted(start, side="left") : dates.searchsorted(end, side="right")]
+
+
+def slice_evaluations_by_season(df, season_dates):
+    """
+    Returns evaluation rows referenced on/after the season start whose target ends by the season end.
+    Horizons are non-negative, so target_end_date >= reference_date and the reference date
+    range can be sliced first; only that slice is then checked against target_end_date.
+    """
+    season_df = slice_by_date_range(df, "reference_date", season_dates["start"], season_dates["end"])
+    return season_df[season_df["target_end_date"] <= season_dates["end"]]
+
+
+def pivot_output_type_ids(df, index_cols):
+    """
+    Reshapes long-format model output into one "value" column per `output_type_id`.
+    Same result as `pivot_table` (duplicates are averaged, all-NaN rows/columns dropped),
+    but done with a single groupby + unstack instead of pivot_table's generic machinery.
+    """
+    wide_df = df.groupby(index_cols + ["output_type_id"])["value"].mean().unstack("output_type_id")
+    return wide_df.dropna(how="all").dropna(axis=1, how="all").reset_index()
+
+
+def validate_csv_header(csv_path, required_cols):
+    """
+    Checks that a CSV file's header row contains all `required_cols`, reading only that first line.
+    Raises ValueError listing any missing columns, so a malformed file fails before the full parse.
+    """
+    # utf-8-sig drops a leading BOM, matching how pd.read_csv reads the header
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+
+    missing_cols = [col for col in required_cols if col not in header]
+    if missing_cols:
+        raise ValueError(f"{csv_path} is missing required columns {missing_cols} (found: {header})")
+
+
+def pivot_hospitalization_quantiles(hosp_df):
+    """
+    Keeps the DESIRED_QUANTILES rows of hospitalization predictions and pivots them into one column per quantile.
+    Shared by the "unprocessed" and "archive" sources once their columns are aligned.
+    Returns an empty DataFrame when none of the desired quantiles are present.
+    """
+    hosp_df = hosp_df.assign(output_type_id=hosp_df["output_type_id"].astype(str))
+
+    # Keep only desired quantiles
+    hosp_df = hosp_df[hosp_df["output_type_id"].isin(DESIRED_QUANTILES)]
+    if hosp_df.empty:
+        return pd.DataFrame()
+
+    # Pivot to get quantile columns
+    wide_df = pivot_output_type_ids(hosp_df, ["reference_date", "target_end_date", "location", "model"])
+
+    # Ensure column names are strings
+    wide_df.columns = [str(c) for c in wide_df.columns]
+    return wide_df
+
+
+def read_model_prediction_file(model, csv_file):
+    """Reads a single model output CSV file, tagged with the model it belongs to."""
+    file_df = pd.read_csv(csv_file, low_memory=False, dtype={"location": str})
+    file_df["model"] = model
+    return file_df
+
+
+def load_model_prediction_files(source_dir, model_names, source_label):
+    """
+    Reads every model's CSV files under `source_dir/<model>/` into a single DataFrame,
+    tagged with a "model" column. All files are concatenated once at the end,
+    rather than per model and then again across models.
+    """
+    file_models = []
+    csv_files = []
+    for model in model_names:
+        # One scandir pass per model directory; a missing (or non-directory) path just means no files, as with glob
+        try:
+            with os.scandir(source_dir / model) as entries:
+                # Skips dotfiles like glob("*.csv") did
+                model_csv_files = [
+                    Path(entry.path) for entry in entries if entry.name.endswith(".csv") and not entry.name.startswith(".") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            model_csv_files = []
+        if not model_csv_files:
+            print(f"   - No {source_label} files found for {model}")
+            continue
+
+        file_models.extend([model] * len(model_csv_files))
+        csv_files.extend(model_csv_files)
+
+    # pandas' C parser releases the GIL, so reading files on a thread pool overlaps I/O and parsing
+    with ThreadPoolExecutor() as executor:
+        model_file_dfs = list(executor.map(read_model_prediction_file, file_models, csv_files))
+
+    if not model_file_dfs:
+        return pd.DataFrame()
+
+    predictions_df = pd.concat(model_file_dfs, ignore_index=True)
+
+    # Low-cardinality label columns only need each distinct string stored once.
+    # (Done after the concat: concatenating categoricals with differing categories falls back to object.)
+    for col in ["target", "output_type", "type"]:
+        if col in predictions_df.columns:
+            predictions_df[col] = predictions_df[col].astype("category")
+
+    return predictions_df
+
+
 # Generate all possible horizon combinations
 def generate_horizon_combinations(horizons):
     """Generate all possible combinations of horizons"""
-    from itertools import combinations
-
-    all_combinations = []
-    for r in range(1, len(horizons) + 1):
-        for combo in combinations(horizons, r):
-            all_combinations.append(list(combo))
-    return all_combinations
+    return [list(combo) for r in range(1, len(horizons) + 1) for combo in combinations(horizons, r)]
 
 
 # ==================================
@@ -94,8 +225,10 @@ def main():
         locations_df = pd.read_csv(data_processing_dir / "locations.csv", dtype={"location": str})
         locations_df = locations_df.loc[:, ~locations_df.columns.str.contains("^Unnamed")]  # Remove empty columns
 
+        gt_path = raw_data_dir / "ground-truth/target-hospital-admissions.csv"
+        validate_csv_header(gt_path, ["date", "location", "value", "weekly_rate"])
         gt_df = pd.read_csv(
-            raw_data_dir / "ground-truth/target-hospital-admissions.csv",
+            gt_path,
             parse_dates=["date"],
             dtype={"location": str},
         )
@@ -109,9 +242,16 @@ def main():
 
         # Load evaluation score data
         eval_score_dir = raw_data_dir / "evaluations-score"
-        wis_df = pd.read_csv(eval_score_dir / "WIS_ratio.csv", dtype={"location": str, "horizon": int})
-        mape_df = pd.read_csv(eval_score_dir / "MAPE.csv", dtype={"Location": str, "horizon": int})
-        coverage_df = pd.read_csv(eval_score_dir / "coverage.csv", dtype={"location": str, "horizon": int})
+        validate_csv_header(eval_score_dir / "WIS_ratio.csv", ["Model", "location", "horizon", "reference_date", "wis_ratio"])
+        validate_csv_header(eval_score_dir / "MAPE.csv", ["Model", "Location", "horizon", "reference_date", "MAPE"])
+        validate_csv_header(
+            eval_score_dir / "coverage.csv",
+            ["Model", "location", "horizon", "reference_date"] + [f"{cov}_cov" for cov in [10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 98]],
+        )
+        # Parse reference dates while reading, rather than converting the columns afterwards
+        wis_df = pd.read_csv(eval_score_dir / "WIS_ratio.csv", dtype={"location": str, "horizon": int}, parse_dates=["reference_date"])
+        mape_df = pd.read_csv(eval_score_dir / "MAPE.csv", dtype={"Location": str, "horizon": int}, parse_dates=["reference_date"])
+        coverage_df = pd.read_csv(eval_score_dir / "coverage.csv", dtype={"location": str, "horizon": int}, parse_dates=["reference_date"])
 
         # Define model names (should match epistorm-constants.ts)
         model_names = [
@@ -130,42 +270,10 @@ def main():
         # We need to process them separately then combine
 
         # Load "unprocessed" (new format) prediction files
-        unprocessed_dfs = []
-        for model in model_names:
-            model_path = raw_data_dir / f"unprocessed/{model}"
-            csv_files = list(model_path.glob("*.csv"))
-            if not csv_files:
-                print(f"   - No unprocessed files found for {model}")
-                continue
-
-            # Concatenate all CSV files for this model
-            model_df = pd.concat(
-                (pd.read_csv(f, low_memory=False, dtype={"location": str}) for f in csv_files),
-                ignore_index=True,
-            )
-            model_df["model"] = model
-            unprocessed_dfs.append(model_df)
-
-        unprocessed_df = pd.concat(unprocessed_dfs, ignore_index=True) if unprocessed_dfs else pd.DataFrame()
+        unprocessed_df = load_model_prediction_files(raw_data_dir / "unprocessed", model_names, "unprocessed")
 
         # Load "archive" (old format) prediction files
-        archive_dfs = []
-        for model in model_names:
-            archive_path = raw_data_dir / f"archive/{model}"
-            csv_files = list(archive_path.glob("*.csv"))
-            if not csv_files:
-                print(f"   - No archive files found for {model}")
-                continue
-
-            # Concatenate all CSV files for this model
-            model_df = pd.concat(
-                (pd.read_csv(f, low_memory=False, dtype={"location": str}) for f in csv_files),
-                ignore_index=True,
-            )
-            model_df["model"] = model
-            archive_dfs.append(model_df)
-
-        archive_df = pd.concat(archive_dfs, ignore_index=True) if archive_dfs else pd.DataFrame()
+        archive_df = load_model_prediction_files(raw_data_dir / "archive", model_names, "archive")
 
         # For archive predictions data only, need to shift all "forecast_date" column values to 2 days back for all rows, since the convention changed from Friday-Saturday to Saturday-Saturday)
         archive_df["forecast_date"] = pd.to_datetime(archive_df["forecast_date"])
@@ -182,6 +290,9 @@ def main():
     except FileNotFoundError as e:
         print(f"FATAL ERROR: A required data file was not found: {e}")
         return
+    except ValueError as e:
+        print(f"FATAL ERROR: A required data file is malformed: {e}")
+        return
     except Exception as e:
         print(f"FATAL ERROR: Error loading data files: {e}")
         return
@@ -217,11 +328,7 @@ def main():
             nowcast_trends_df["output_type_id"] = nowcast_trends_df["output_type_id"].str.removeprefix("large_")
 
             # Pivot to get stable/increase/decrease columns
-            all_nowcasts_df = nowcast_trends_df.pivot_table(
-                index=["reference_date", "location", "model"],
-                columns="output_type_id",
-                values="value",
-            ).reset_index()
+            all_nowcasts_df = pivot_output_type_ids(nowcast_trends_df, ["reference_date", "location", "model"])
 
             # Ensure all required columns exist
             for col in ["stable", "increase", "decrease"]:
@@ -239,23 +346,10 @@ def main():
 
     if not unprocessed_df.empty:
         # Filter for hospitalization predictions
-        hosp_preds_df = unprocessed_df[unprocessed_df["target"] == "wk inc flu hosp"].copy()
-        hosp_preds_df["output_type_id"] = hosp_preds_df["output_type_id"].astype(str)
-
-        # Keep only desired quantiles
-        desired_quantiles = ["0.025", "0.05", "0.25", "0.5", "0.75", "0.95", "0.975"]
-        hosp_preds_df = hosp_preds_df[hosp_preds_df["output_type_id"].isin(desired_quantiles)]
-
-        if not hosp_preds_df.empty:
-            # Pivot to get quantile columns
-            processed_unprocessed_preds_df = hosp_preds_df.pivot_table(
-                index=["reference_date", "target_end_date", "location", "model"],
-                columns="output_type_id",
-                values="value",
-            ).reset_index()
-
-            # Ensure column names are strings
-            processed_unprocessed_preds_df.columns = [str(c) for c in processed_unprocessed_preds_df.columns]
+        hosp_preds_df = unprocessed_df[unprocessed_df["target"] == "wk inc flu hosp"]
+        processed_unprocessed_preds_df = pivot_hospitalization_quantiles(hosp_preds_df)
+
+        if not processed_unprocessed_preds_df.empty:
             print(f"   - Processed unprocessed predictions. Shape: {processed_unprocessed_preds_df.shape}")
 
     # --- C) Process ARCHIVE Hospitalization Predictions ---
@@ -278,24 +372,10 @@ def main():
         )
 
         # Filter for hospitalization predictions (may have different target strings in archive)
-        hosp_archive_df = archive_clean_df[archive_clean_df["target"].str.contains("inc flu hosp", na=False)].copy()
-
-        hosp_archive_df["output_type_id"] = hosp_archive_df["output_type_id"].astype(str)
+        hosp_archive_df = archive_clean_df[archive_clean_df["target"].str.contains("inc flu hosp", na=False)]
+        processed_archive_preds_df = pivot_hospitalization_quantiles(hosp_archive_df)
 
-        # Keep only desired quantiles
-        desired_quantiles = ["0.025", "0.05", "0.25", "0.5", "0.75", "0.95", "0.975"]
-        hosp_archive_df = hosp_archive_df[hosp_archive_df["output_type_id"].isin(desired_quantiles)]
-
-        if not hosp_archive_df.empty:
-            # Pivot to get quantile columns
-            processed_archive_preds_df = hosp_archive_df.pivot_table(
-                index=["reference_date", "target_end_date", "location", "model"],
-                columns="output_type_id",
-                values="value",
-            ).reset_index()
-
-            # Ensure column names are strings
-            processed_archive_preds_df.columns = [str(c) for c in processed_archive_preds_df.columns]
+        if not processed_archive_preds_df.empty:
             print(f"   - Processed archive predictions. Shape: {processed_archive_preds_df.shape}")
 
     # --- D) Combine All Prediction DataFrames ---
@@ -314,11 +394,16 @@ def main():
     all_preds_df["target_end_date"] = pd.to_datetime(all_preds_df["target_end_date"])
 
     # Calculate horizon (weeks between reference and target dates)
-    all_preds_df["horizon"] = ((all_preds_df["target_end_date"] - all_preds_df["reference_date"]).dt.days / 7).astype(int)
+    # Whole days apart, computed directly on the datetime64 arrays instead of through a Timedelta Series
+    days_ahead = (all_preds_df["target_end_date"].to_numpy() - all_preds_df["reference_date"].to_numpy()) // ONE_DAY
+    all_preds_df["horizon"] = (days_ahead / 7).astype(int)
 
     # Keep only horizons 0, 1, 2, 3 (as per project requirements)
     all_preds_df = all_preds_df[all_preds_df["horizon"].isin([0, 1, 2, 3])]
 
+    # Sort once by reference date, so each season can be sliced out with a binary search
+    all_preds_df = all_preds_df.sort_values("reference_date", kind="mergesort")
+
     print(f"   - Final combined predictions. Shape: {all_preds_df.shape}")
 
     # --- F) Process Ground Truth Data ---
@@ -343,10 +428,10 @@ def main():
 
     # Find the overall date range across all data
     all_gt_dates = gt_df["date"]
-    all_pred_dates = pd.concat([all_preds_df["reference_date"], all_preds_df["target_end_date"]])
 
     earliest_date = all_gt_dates.min()
-    latest_date = all_pred_dates.max()
+    # Latest of both prediction date columns, without concatenating them into one Series
+    latest_date = max(all_preds_df["reference_date"].max(), all_preds_df["target_end_date"].max())
 
     print(f"   - Overall date range: {earliest_date.strftime('%Y-%m-%d')} to {latest_date.strftime('%Y-%m-%d')}")
 
@@ -506,14 +591,14 @@ def main():
     print("     - Partitioning Nowcast trends by season...")
     nowcast_trends_by_season = {}
     if not all_nowcasts_df.empty:
+        all_nowcasts_df = all_nowcasts_df.sort_values("reference_date", kind="mergesort")
+
         # Process each full range season for nowcast trends
         for season_id, dates in full_range_seasons_info_for_processing.items():
             print(f"   - Processing nowcast trends for season: {season_id}")
 
             # Filter nowcast data for this season
-            season_nowcast_df = all_nowcasts_df[
-                (all_nowcasts_df["reference_date"] >= dates["start"]) & (all_nowcasts_df["reference_date"] <= dates["end"])
-            ].copy()
+            season_nowcast_df = slice_by_date_range(all_nowcasts_df, "reference_date", dates["start"], dates["end"])
 
             if season_nowcast_df.empty:
                 nowcast_trends_by_season[season_id] = {}
@@ -523,7 +608,7 @@ def main():
             season_nowcast_dict = {}
             for _, row in season_nowcast_df.iterrows():
                 model = row["model"]
-                date_iso = row["reference_date"].strftime("%Y-%m-%d")
+                date_iso = format_iso_date(row["reference_date"])
                 location = row["location"]
 
                 season_nowcast_dict.setdefault(model, {}).setdefault(date_iso, {})[location] = {
@@ -543,6 +628,11 @@ def main():
     # Create indexed dataframes for efficient lookups
     gt_df_indexed = gt_df_fixed.set_index(["date", "stateNum"]).sort_index()
     preds_df_indexed = all_preds_df.set_index(["reference_date", "location", "model"]).sort_index()
+    # Split predictions by model once; each group keeps the reference_date ordering, so seasons can be sliced from it
+    preds_by_model = {model_name: model_df for model_name, model_df in all_preds_df.groupby("model", sort=False)}
+    no_preds_df = all_preds_df.iloc[0:0]
+    # The fixed ground truth is date-major, so its unique dates are already sorted; each partition slices them
+    gt_unique_dates = pd.DataFrame({"date": gt_df_fixed["date"].unique()})
     all_locations = locations_df["location"].unique()
 
     # IMPORTANT: Only process full range seasons for time series partitioning
@@ -551,7 +641,7 @@ def main():
         print(f"   - Processing time series for season: {season_id}")
 
         # Filter predictions for this season
-        season_preds = all_preds_df[(all_preds_df["reference_date"] >= dates["start"]) & (all_preds_df["reference_date"] <= dates["end"])]
+        season_preds = slice_by_date_range(all_preds_df, "reference_date", dates["start"], dates["end"])
 
         # Initialize structure according to DataContract.md
         time_series_data[season_id] = {}
@@ -575,7 +665,7 @@ def main():
 
         # Process each model separately within this season
         for model_name in model_names:
-            model_preds = season_preds[season_preds["model"] == model_name]
+            model_preds = slice_by_date_range(preds_by_model.get(model_name, no_preds_df), "reference_date", dates["start"], dates["end"])
 
             # Calculate model-specific dates within this season
             if model_preds.empty:
@@ -602,10 +692,10 @@ def main():
 
             # Define partition date ranges according to AboutDateTime.md
             partition_ranges = {
-                "pre-forecast": (dates["start"], first_pred_ref_date - timedelta(days=1)),
+                "pre-forecast": (dates["start"], first_pred_ref_date - ONE_DAY),
                 "full-forecast": (first_pred_ref_date, last_pred_ref_date),
-                "forecast-tail": (last_pred_ref_date + timedelta(days=1), last_pred_target_date),
-                "post-forecast": (last_pred_target_date + timedelta(days=1), dates["end"]),
+                "forecast-tail": (last_pred_ref_date + ONE_DAY, last_pred_target_date),
+                "post-forecast": (last_pred_target_date + ONE_DAY, dates["end"]),
             }
 
             # Process each partition
@@ -617,14 +707,8 @@ def main():
                 partition_data = {}
 
                 # Get all dates that fall within this partition
-                gt_dates_in_partition = gt_df_fixed.loc[
-                    (gt_df_fixed["date"] >= start_date) & (gt_df_fixed["date"] <= end_date),
-                    "date",
-                ]
-                pred_dates_in_partition = model_preds.loc[
-                    (model_preds["reference_date"] >= start_date) & (model_preds["reference_date"] <= end_date),
-                    "reference_date",
-                ]
+                gt_dates_in_partition = slice_by_date_range(gt_unique_dates, "date", start_date, end_date)["date"]
+                pred_dates_in_partition = slice_by_date_range(model_preds, "reference_date", start_date, end_date)["reference_date"]
 
                 # Combine and get unique dates
                 all_unique_dates = pd.concat([gt_dates_in_partition, pred_dates_in_partition]).unique()
@@ -634,7 +718,7 @@ def main():
                     if not (start_date <= pd.to_datetime(ref_date) <= end_date):
                         continue
 
-                    ref_date_iso = pd.to_datetime(ref_date).strftime("%Y-%m-%d")
+                    ref_date_iso = format_iso_date(pd.to_datetime(ref_date))
 
                     if ref_date_iso not in partition_data:
                         partition_data[ref_date_iso] = {}
@@ -670,7 +754,7 @@ def main():
 
                                 # Process each prediction row (different horizons)
                                 for _, pred_row in preds_on_date.iterrows():
-                                    target_date_iso = pred_row["target_end_date"].strftime("%Y-%m-%d")
+                                    target_date_iso = format_iso_date(pred_row["target_end_date"])
                                     predictions_dict[target_date_iso] = {
                                         "horizon": int(pred_row["horizon"]),
                                         "median": float(pred_row["0.5"]) if pd.notna(pred_row["0.5"]) else 0.0,
@@ -694,6 +778,16 @@ def main():
     print("Step 5b: Processing centralized ground truth data...")
     ground_truth_data = {}
 
+    # Build the (date, location) lookup once, instead of masking the whole frame for every date and state
+    first_gt_rows = gt_df_fixed.drop_duplicates(subset=["date", "stateNum"], keep="first")
+    first_gt_rows = first_gt_rows[first_gt_rows["admissions"] >= 0]
+    gt_lookup = {
+        (date, state_num): {"admissions": float(admissions), "weeklyRate": float(weekly_rate)}
+        for date, state_num, admissions, weekly_rate in zip(
+            first_gt_rows["date"], first_gt_rows["stateNum"], first_gt_rows["admissions"], first_gt_rows["weeklyRate"]
+        )
+    }
+
     # Process each full range season for ground truth
     for season_id, dates in full_range_seasons_info_for_processing.items():
         print(f"   - Processing ground truth for season: {season_id}")
@@ -704,21 +798,14 @@ def main():
         season_dates = pd.date_range(start=dates["start"], end=dates["end"], freq="W-SAT")
 
         for ref_date in season_dates:
-            ref_date_iso = ref_date.strftime("%Y-%m-%d")
+            ref_date_iso = format_iso_date(ref_date)
             ground_truth_data[season_id][ref_date_iso] = {}
 
             # Get ground truth for all states on this date
             for state_num in all_locations:
-                try:
-                    gt_row = gt_df_fixed[(gt_df_fixed["date"] == ref_date) & (gt_df_fixed["stateNum"] == state_num)]
-                    if not gt_row.empty and pd.notna(gt_row.iloc[0]["admissions"]) and gt_row.iloc[0]["admissions"] >= 0:
-                        ground_truth_data[season_id][ref_date_iso][state_num] = {
-                            "admissions": float(gt_row.iloc[0]["admissions"]),
-                            "weeklyRate": float(gt_row.iloc[0]["weeklyRate"]),
-                        }
-                except (KeyError, IndexError):
-                    # No ground truth data for this date/location
-                    pass
+                gt_entry = gt_lookup.get((ref_date, state_num))
+                if gt_entry is not None:
+                    ground_truth_data[season_id][ref_date_iso][state_num] = gt_entry
 
     print(f"   - Ground truth data processed for {len(ground_truth_data)} seasons")
 
@@ -767,9 +854,8 @@ def main():
     # Combine standard metrics (WIS, MAPE, Coverage for state map)
     eval_scores_df = pd.concat([wis_df, mape_df, coverage_scores_df], ignore_index=True)
 
-    # Standardize date and location formats
+    # Standardize location formats (reference dates are already parsed on read)
     for df in [eval_scores_df, coverage_long_df]:
-        df["reference_date"] = pd.to_datetime(df["reference_date"])
         df["stateNum"] = df["stateNum"].astype(str).str.zfill(2)
 
     # Calculate target_end_date for proper filtering against time ranges generated using referenceDate's perspective
@@ -777,10 +863,15 @@ def main():
     eval_scores_df["target_end_date"] = eval_scores_df["reference_date"] + pd.to_timedelta(eval_scores_df["horizon"] * 7, unit="D")
     coverage_long_df["target_end_date"] = coverage_long_df["reference_date"] + pd.to_timedelta(coverage_long_df["horizon"] * 7, unit="D")
 
+    # Sort once by reference date, so each season can be sliced out with a binary search
+    eval_scores_df = eval_scores_df.sort_values("reference_date", kind="mergesort")
+    coverage_long_df = coverage_long_df.sort_values("reference_date", kind="mergesort")
+
     print("   - Evaluation score files cleaned and standardized")
 
-    # Combine all seasons for comprehensive assignment
-    all_seasons_combined = {**full_range_seasons_info_for_processing, **dynamic_periods}
+    # Combine all seasons for comprehensive assignment (season and dynamic period ids never overlap,
+    # so chaining the two is the same as merging them, without building a new dict)
+    all_seasons_combined = chain(full_range_seasons_info_for_processing.items(), dynamic_periods.items())
 
     # Create season-specific evaluation datasets
     print("\n   - Creating season-specific evaluation datasets...")
@@ -789,18 +880,14 @@ def main():
     coverage_data = {}
 
     # Process each season independently
-    for season_id, season_dates in all_seasons_combined.items():
+    for season_id, season_dates in all_seasons_combined:
         print(f"\n   - Processing evaluation data for season: {season_id}")
         print(f"     Date range: {season_dates['start'].strftime('%Y-%m-%d')} to {season_dates['end'].strftime('%Y-%m-%d')}")
 
         # Filter evaluation data for this specific season
-        season_eval_df = eval_scores_df[
-            (eval_scores_df["reference_date"] >= season_dates["start"]) & (eval_scores_df["target_end_date"] <= season_dates["end"])
-        ].copy()
-
-        season_coverage_df = coverage_long_df[
-            (coverage_long_df["reference_date"] >= season_dates["start"]) & (coverage_long_df["target_end_date"] <= season_dates["end"])
-        ].copy()
+        # Both slices are only read (logged and aggregated), so no copies are taken
+        season_eval_df = slice_evaluations_by_season(eval_scores_df, season_dates)
+        season_coverage_df = slice_evaluations_by_season(coverage_long_df, season_dates)
 
         print(f"     Evaluation entries: {len(season_eval_df)}")
         print(f"     Coverage entries: {len(season_coverage_df)}")
@@ -845,7 +932,7 @@ def main():
                     for state_data in model_data.values():
                         available_horizons.update(state_data.keys())
 
-            available_horizons = sorted(list(available_horizons))
+            available_horizons = sorted(available_horizons)
             horizon_combinations = generate_horizon_combinations(available_horizons)
 
             print(f"     Calculating IQR for {len(horizon_combinations)} horizon combinations: {horizon_combinations}")
@@ -907,11 +994,9 @@ def main():
     # Process each season for raw scores
     for season_id, season_dates in full_range_seasons_info_for_processing.items():
         # Filter evaluation data for this specific season
-        season_eval_df = eval_scores_df[
-            (eval_scores_df["reference_date"] >= season_dates["start"]) & (eval_scores_df["target_end_date"] <= season_dates["end"])
-        ].copy()
+        season_eval_df = slice_evaluations_by_season(eval_scores_df, season_dates)
 
-        season_eval_df = season_eval_df[season_eval_df["metric"] != "Coverage"].copy()
+        season_eval_df = season_eval_df[season_eval_df["metric"] != "Coverage"]
 
         if len(season_eval_df) == 0:
             continue
@@ -920,19 +1005,18 @@ def main():
         grouped = season_eval_df.groupby(["metric", "model", "stateNum", "horizon"])
 
         for (metric, model, state_num, horizon), group_df in grouped:
-            # Convert dates to ISO strings and create score entries
-            score_entries = []
-            for _, row in group_df.iterrows():
-                score_entries.append(
-                    {
-                        "referenceDate": row["reference_date"].strftime("%Y-%m-%d"),
-                        "targetEndDate": row["target_end_date"].strftime("%Y-%m-%d"),
-                        "score": float(row["score"]),
-                    }
-                )
+            # Convert dates to ISO strings and create score entries (zipped columns, no per-row Series)
+            score_entries = [
+                {
+                    "referenceDate": format_iso_date(reference_date),
+                    "targetEndDate": format_iso_date(target_end_date),
+                    "score": float(score),
+                }
+                for reference_date, target_end_date, score in zip(group_df["reference_date"], group_df["target_end_date"], group_df["score"])
+            ]
 
             # Sort by reference date
-            score_entries.sort(key=lambda x: x["referenceDate"])
+            score_entries.sort(key=itemgetter("referenceDate"))
 
             # Store in nested structure
             horizon_int = int(horizon)
@@ -4,30 +4,33 @@ from pathlib import Path
 
 def process_locations(locations_df: pd.DataFrame):
     """Processes the locations data into a list of dictionaries."""
-    locations_list = []
-    for _, row in locations_df.iterrows():
-        locations_list.append(
-            {
-                "stateNum": row["location"],
-                "state": row["abbreviation"],
-                "stateName": row["location_name"],
-                "population": int(row["population"]),
-            }
+    # Walk the columns directly instead of building a Series per row with iterrows()
+    return [
+        {
+            "stateNum": location,
+            "state": abbreviation,
+            "stateName": location_name,
+            "population": int(population),
+        }
+        for location, abbreviation, location_name, population in zip(
+            locations_df["location"], locations_df["abbreviation"], locations_df["location_name"], locations_df["population"]
         )
-    return locations_list
+    ]
 
 
 def process_thresholds(thresholds_df: pd.DataFrame):
     """Processes the thresholds data into a dictionary."""
     thresholds_df.rename(columns={"Location": "stateNum"}, inplace=True)
-    thresholds_dict = {}
-    for _, row in thresholds_df.iterrows():
-        thresholds_dict[row["stateNum"]] = {
-            "medium": float(row["Medium"]),
-            "high": float(row["High"]),
-            "veryHigh": float(row["Very High"]),
+    return {
+        state_num: {
+            "medium": float(medium),
+            "high": float(high),
+            "veryHigh": float(very_high),
         }
-    return thresholds_dict
+        for state_num, medium, high, very_high in zip(
+            thresholds_df["stateNum"], thresholds_df["Medium"], thresholds_df["High"], thresholds_df["Very High"]
+        )
+    }
 
 
 def process_historical_ground_truth(historical_gt_path: Path):
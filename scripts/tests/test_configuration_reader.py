@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import configuration_reader  # noqa: E402
+from configuration_reader import ConfigError, read_config  # noqa: E402
+
+
+class ReadConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        configuration_reader._CFG_CACHE.clear()
+        self.addCleanup(configuration_reader._CFG_CACHE.clear)
+
+    def write_config(self, name, text):
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(text)
+        return str(path)
+
+    def test_cached_config_is_not_shared_between_callers(self):
+        config_file = self.write_config("c.yaml", "- a\n- b\n")
+
+        first = read_config(config_file)
+        first.append("X")
+
+        self.assertEqual(read_config(config_file), ["a", "b"])
+        self.assertIsNot(read_config(config_file), read_config(config_file))
+
+    def test_parse_error_names_the_config_file(self):
+        config_file = self.write_config("bad.yaml", "a: [1\n")
+
+        with self.assertLogs(level="ERROR") as logs, self.assertRaises(ConfigError) as ctx:
+            read_config(config_file)
+
+        self.assertIn('in "%s"' % config_file, str(ctx.exception))
+        self.assertIn(config_file, logs.output[0])
+
+    def test_constructor_error_is_not_retried_through_fallback(self):
+        config_file = self.write_config("bad_date.yaml", "d: 2020-13-45\n")
+
+        with mock.patch.object(configuration_reader.yaml, "load", wraps=configuration_reader.yaml.load) as load:
+            with self.assertLogs(level="ERROR"), self.assertRaisesRegex(ConfigError, "month must be in 1..12") as ctx:
+                read_config(config_file)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertIsInstance(ctx.exception.__cause__, ValueError)
+
+    def test_empty_config_is_served_from_the_cache(self):
+        config_file = self.write_config("empty.yaml", "")
+        self.assertIsNone(read_config(config_file))
+
+        with mock.patch.object(configuration_reader, "_load_yaml") as load_yaml:
+            self.assertIsNone(read_config(config_file))
+        load_yaml.assert_not_called()
+
+    def test_no_files_are_written_next_to_the_config(self):
+        config_file = self.write_config("c.yaml", "a: 1\n")
+        read_config(config_file)
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["c.yaml"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from data_processing import (  # noqa: E402
+    load_model_prediction_files,
+    pivot_output_type_ids,
+    slice_by_date_range,
+    slice_evaluations_by_season,
+    validate_csv_header,
+)
+
+
+class ValidateCsvHeaderTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_csv(self, name, text, encoding="utf-8"):
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(text, encoding=encoding)
+        return path
+
+    def test_accepts_matching_header(self):
+        path = self.write_csv("WIS_ratio.csv", "Model,location,horizon,reference_date,wis_ratio\n")
+        validate_csv_header(path, ["Model", "location", "horizon", "reference_date", "wis_ratio"])
+
+    def test_accepts_bom_prefixed_header(self):
+        path = self.write_csv("WIS_ratio.csv", "Model,location,horizon,reference_date,wis_ratio\nM,US,0,2024-01-06,1.0\n", encoding="utf-8-sig")
+        required_cols = ["Model", "location", "horizon", "reference_date", "wis_ratio"]
+
+        # pandas strips the BOM, so the validator must accept the same file
+        self.assertEqual(list(pd.read_csv(path).columns), required_cols)
+        validate_csv_header(path, required_cols)
+
+    def test_rejects_missing_columns(self):
+        path = self.write_csv("MAPE.csv", "Model,Location,horizon\n")
+        with self.assertRaisesRegex(ValueError, r"\['reference_date', 'MAPE'\]"):
+            validate_csv_header(path, ["Model", "Location", "horizon", "reference_date", "MAPE"])
+
+
+class PivotOutputTypeIdsTest(unittest.TestCase):
+    def test_matches_pivot_table(self):
+        nan = float("nan")
+        long_df = pd.DataFrame(
+            {
+                "reference_date": pd.to_datetime(["2024-01-06"] * 6 + ["2024-01-13"] * 3),
+                "location": ["US", "US", "US", "US", "01", "01", "US", "US", "US"],
+                "model": ["A"] * 9,
+                # "0.5" for US on 2024-01-06 is duplicated and gets averaged
+                "output_type_id": ["0.5", "0.5", "0.25", "0.975", "0.5", "0.975", "0.5", "0.25", "0.975"],
+                # "0.975" is NaN everywhere, and 2024-01-13 is NaN on every id, so both are dropped
+                "value": [1.0, 3.0, 2.0, nan, 5.0, nan, nan, nan, nan],
+            }
+        )
+        index_cols = ["reference_date", "location", "model"]
+
+        expected = long_df.pivot_table(index=index_cols, columns="output_type_id", values="value").reset_index()
+        result = pivot_output_type_ids(long_df, index_cols)
+
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertNotIn("0.975", result.columns)
+        self.assertEqual(result.loc[result["location"] == "US", "0.5"].item(), 2.0)
+
+
+class SliceByDateRangeTest(unittest.TestCase):
+    def test_bounds_are_inclusive(self):
+        dates = pd.to_datetime(["2024-01-06", "2024-01-06", "2024-01-13", "2024-01-20", "2024-01-27", "2024-01-27"])
+        df = pd.DataFrame({"reference_date": dates, "value": range(len(dates))})
+
+        result = slice_by_date_range(df, "reference_date", pd.Timestamp("2024-01-13"), pd.Timestamp("2024-01-27"))
+
+        self.assertEqual(result["value"].tolist(), [2, 3, 4, 5])
+
+    def test_matches_boolean_mask(self):
+        dates = pd.to_datetime(["2024-01-06", "2024-01-13", "2024-01-13", "2024-01-20", "2024-02-03"])
+        df = pd.DataFrame({"reference_date": dates, "value": range(len(dates))})
+
+        for start, end in [("2024-01-01", "2024-01-05"), ("2024-01-10", "2024-01-20"), ("2024-01-06", "2024-02-03"), ("2024-01-21", "2024-01-14")]:
+            start, end = pd.Timestamp(start), pd.Timestamp(end)
+            expected = df[(df["reference_date"] >= start) & (df["reference_date"] <= end)]
+            pd.testing.assert_frame_equal(slice_by_date_range(df, "reference_date", start, end), expected)
+
+
+class SliceEvaluationsBySeasonTest(unittest.TestCase):
+    def test_matches_original_two_sided_mask(self):
+        reference_dates = pd.to_datetime(["2023-07-29", "2023-08-05", "2023-08-05", "2024-07-20", "2024-07-27", "2024-08-03"])
+        horizons = [3, 0, 3, 3, 0, 0]
+        eval_df = pd.DataFrame({"reference_date": reference_dates, "horizon": horizons})
+        eval_df["target_end_date"] = eval_df["reference_date"] + pd.to_timedelta(eval_df["horizon"] * 7, unit="D")
+        season_dates = {"start": pd.Timestamp("2023-08-01"), "end": pd.Timestamp("2024-07-31")}
+
+        expected = eval_df[(eval_df["reference_date"] >= season_dates["start"]) & (eval_df["target_end_date"] <= season_dates["end"])]
+        result = slice_evaluations_by_season(eval_df, season_dates)
+
+        pd.testing.assert_frame_equal(result, expected)
+        # Rows referenced before the season, or whose target runs past its end, are excluded
+        self.assertEqual(result.index.tolist(), [1, 2, 4])
+
+
+class LoadModelPredictionFilesTest(unittest.TestCase):
+    def test_missing_or_non_directory_model_paths_have_no_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir)
+            (source_dir / "A").mkdir()
+            (source_dir / "A" / "2024-01-06-A.csv").write_text("reference_date,location,value\n2024-01-06,US,1.0\n")
+            (source_dir / "B").write_text("not a directory")
+
+            result = load_model_prediction_files(source_dir, ["A", "B", "C"], "unprocessed")
+
+        self.assertEqual(result["model"].tolist(), ["A"])
+        self.assertEqual(result["location"].tolist(), ["US"])
+
+
+if __name__ == "__main__":
+    unittest.main()